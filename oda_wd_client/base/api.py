@@ -1,13 +1,18 @@
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Iterator
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, Iterable, Iterator
 from urllib.parse import urljoin
 
 from suds import client as suds_client
 from suds import sudsobject, wsse
+from suds.cache import ObjectCache
 from suds.plugin import MessagePlugin
 
 from oda_wd_client.base.logging import log
+from oda_wd_client.base.tools import batched, copy_suds_object
 
 
 class SudsHax(MessagePlugin):
@@ -59,6 +64,15 @@ class SudsLog(MessagePlugin):
 # credentials requires us to reload the app anyway.
 _workday_clients: dict[str, suds_client.Client] = {}
 
+# Suds clients keep state for the last sent and received message, so a client can't be used by more than one thread at
+# a time. Requests from worker threads borrow a client from a pool per service instead. The clients in the pools are
+# set up like the main client, and share its WSDL cache.
+_workday_thread_clients: dict[str, SimpleQueue[suds_client.Client]] = {}
+
+# Schema types resolved from the WSDL, keyed on service and type name. Looking up a type by name is a walk through the
+# schema, and we create the same few types over and over again when serializing objects for Workday.
+_workday_types: dict[tuple[str, str], Any] = {}
+
 
 class WorkdayClient:
     """
@@ -86,12 +100,14 @@ class WorkdayClient:
         password: str,
         lazy_init: bool = True,
         log_location: str | None = None,
+        cache_location: str | None = None,
     ) -> None:
         self._auth_base_url = base_url
         self._auth_tenant_name = tenant_name
         self._auth_username = username
         self._auth_password = password
         self._log_location = log_location
+        self._cache_location = cache_location
         # If we do lazy init, we only initialize each service when they're first needed, since there's an overhead
         # with the init process
         if not lazy_init:
@@ -119,7 +135,13 @@ class WorkdayClient:
         plugins = [SudsHax()]
         if self._log_location:
             plugins.append(SudsLog(self._log_location))
-        client = suds_client.Client(url, plugins=plugins)
+        client_kwargs: dict[str, Any] = {}
+        if self._cache_location:
+            # The service version is part of the WSDL URL, so the parsed WSDL and schemas can be kept across processes
+            # for as long as we don't change version. Suds' default cache lives in a temporary directory that's removed
+            # on exit.
+            client_kwargs["cache"] = ObjectCache(location=self._cache_location, days=0)
+        client = suds_client.Client(url, plugins=plugins, **client_kwargs)
         security = wsse.Security()
         token = wsse.UsernameToken(
             f"{self._auth_username}@{self._auth_tenant_name}",
@@ -128,7 +150,8 @@ class WorkdayClient:
         token.setnonce()
         token.setcreated()
         security.tokens.append(token)
-        client.set_options(wsse=security, prettyxml=True)
+        # Pretty printing every envelope is only worth the cost when someone will be reading them
+        client.set_options(wsse=security, prettyxml=bool(self._log_location))
         return client
 
     def get_client(self, service: str) -> suds_client.Client:
@@ -146,6 +169,73 @@ class WorkdayClient:
         method = getattr(self.get_client(self.service).service, method_name)
         return method(*args, **kwargs)
 
+    def _threaded_request(self, method_name: str, *args, **kwargs) -> sudsobject.Object:
+        """
+        Same as `_request`, but safe to use from worker threads
+
+        The request is done on a client borrowed from the pool for the service, so no other thread uses the same client
+        at the same time. A new client is set up when all clients in the pool are in use, which means loading the WSDL
+        again, so there's a cost to the first request from each concurrent thread.
+        """
+        pool = _workday_thread_clients.get(self.service)
+        if pool is None:
+            pool = _workday_thread_clients.setdefault(self.service, SimpleQueue())
+        try:
+            client = pool.get_nowait()
+        except Empty:
+            client = self._setup_client(self._get_client_url(self.service))
+        try:
+            method = getattr(client.service, method_name)
+            return method(*args, **kwargs)
+        finally:
+            pool.put(client)
+
+    def _get_page(
+        self,
+        method_name: str,
+        results_key: str,
+        response_filter: sudsobject.Object,
+        page: int,
+        extra_request_kwargs: dict[str, Any],
+        threaded: bool = False,
+    ) -> tuple[int, list[sudsobject.Object]]:
+        """
+        Get a single page of results
+
+        :param response_filter: Filter with everything but the page number set. It's copied, not modified.
+        :param threaded: Set when called from a worker thread, to do the request through `_threaded_request`
+        :return: Tuple of total number of pages and the results on the requested page
+        """
+        _filter = copy_suds_object(response_filter)
+        _filter.Page = page
+        request = self._threaded_request if threaded else self._request
+        response = request(method_name, Response_Filter=_filter, **extra_request_kwargs)
+
+        # Response_Results / Response_Data might be wrapped in a list, if so, pick out the object
+        # Double check that they only have one item
+        response_results = response.Response_Results
+
+        if isinstance(response_results, list):
+            assert (
+                len(response_results) == 1
+            ), "If Response_Results is a list, it should only have one item"
+            response_results = response_results[0]
+
+        # If we get no results, we won't have any response data attribute, so we need to do an early return
+        #  before attempting to access that data.
+        if int(response_results.Total_Results) == 0:
+            return 0, []
+
+        response_data = response.Response_Data
+
+        if isinstance(response_data, list):
+            assert (
+                len(response_data) == 1
+            ), "If Response_Data is a list, it should only have one item"
+            response_data = response_data[0]
+
+        return int(response_results.Total_Pages), getattr(response_data, results_key)
+
     def _get_paginated(
         self,
         method_name: str,
@@ -153,62 +243,125 @@ class WorkdayClient:
         filters: dict[str, Any] | None = None,
         per_page: int = 100,
         extra_request_kwargs: dict[str, Any] | None = None,
+        workers: int = 1,
     ) -> Iterator[sudsobject.Object]:
-        extra_request_kwargs = extra_request_kwargs or {}
-        page = 1
-        max_page = None
-        while max_page is None or page <= max_page:
-            str_max_page = "Unknown"
-            if max_page:
-                str_max_page = int(max_page)
-            log(
-                "info",
-                f"Getting page {page} of {str_max_page}",
-            )
-            _filter = self.factory("ns0:Response_FilterType")
-
-            if filters:
-                for key, val in filters.items():
-                    setattr(_filter, key, val)
-
-            _filter.Page = page
-            _filter.Count = per_page
-            response = self._request(
-                method_name, Response_Filter=_filter, **extra_request_kwargs
-            )
+        """
+        Iterate over all results of a paginated method
 
-            # Response_Results / Response_Data might be wrapped in a list, if so, pick out the object
-            # Double check that they only have one item
-            response_results = response.Response_Results
+        The first page is fetched up front to learn the number of pages. With `workers` above 1, the remaining pages
+        are fetched by a pool of `workers` threads, keeping at most `workers` pages in flight ahead of the consumer,
+        while results are yielded in page order. Pages that are prefetched are requested even if the consumer stops
+        iterating before reaching them. With `workers` set to 1 or less, each page is only requested when the consumer
+        reaches it.
+        """
+        extra_request_kwargs = extra_request_kwargs or {}
 
-            if isinstance(response_results, list):
-                assert (
-                    len(response_results) == 1
-                ), "If Response_Results is a list, it should only have one item"
-                response_results = response_results[0]
+        # The filter is the same for all pages, except for the page number, so we only build it once
+        response_filter = self.factory("ns0:Response_FilterType")
+        if filters:
+            for key, val in filters.items():
+                setattr(response_filter, key, val)
+        response_filter.Count = per_page
 
-            # If we get no results, we won't have any response data attribute, so we need to do an early return
-            #  before attempting to access that data.
-            if int(response_results.Total_Results) == 0:
-                log("info", "No results")
+        log("info", "Getting page 1 of Unknown")
+        max_page, results = self._get_page(
+            method_name, results_key, response_filter, 1, extra_request_kwargs
+        )
+        if not max_page:
+            log("info", "No results")
+            return
+        yield from results
+        if max_page == 1:
+            return
+
+        if workers <= 1:
+            for page in range(2, max_page + 1):
+                log("info", f"Getting page {page} of {max_page}")
+                _, results = self._get_page(
+                    method_name,
+                    results_key,
+                    response_filter,
+                    page,
+                    extra_request_kwargs,
+                )
+                yield from results
+            return
+
+        pending: deque[Future] = deque()
+        pages = iter(range(2, max_page + 1))
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+        def submit_next() -> None:
+            page = next(pages, None)
+            if page is None:
                 return
+            log("info", f"Getting page {page} of {max_page}")
+            pending.append(
+                executor.submit(
+                    self._get_page,
+                    method_name,
+                    results_key,
+                    response_filter,
+                    page,
+                    extra_request_kwargs,
+                    True,
+                )
+            )
 
-            response_data = response.Response_Data
-
-            if isinstance(response_data, list):
-                assert (
-                    len(response_data) == 1
-                ), "If Response_Data is a list, it should only have one item"
-                response_data = response_data[0]
-
-            max_page = response_results.Total_Pages
-            for result in getattr(response_data, results_key):
-                yield result
-
-            page += 1
+        try:
+            for _ in range(workers):
+                submit_next()
+            while pending:
+                _, results = pending.popleft().result()
+                submit_next()
+                yield from results
+        finally:
+            # Don't wait for prefetched pages if the consumer stops iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _parse_results(
+        results: Iterable[sudsobject.Object],
+        parser: Callable[[sudsobject.Object], Any],
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+    ) -> Iterator[Any]:
+        """
+        Pass results through `parser`, unless the raw suds objects are requested
 
-    def factory(self, name: str) -> sudsobject.Object:
+        If `batch_size` is set, results are yielded in lists of up to `batch_size` items rather than one by one
         """
-        Convenience wrapper
+        if batch_size:
+            for batch in batched(results, batch_size):
+                yield batch if return_suds_object else [parser(obj) for obj in batch]
+        elif return_suds_object:
+            yield from results
+        else:
+            for obj in results:
+                yield parser(obj)
+
+    def factory(
+        self, name: str, prototypes: dict[str, sudsobject.Object] | None = None
+    ) -> sudsobject.Object:
+        """
+        Convenience wrapper around the suds factory, caching the type lookup for each type name
+
+        If `prototypes` is supplied, it's used as a cache of one object per type name, and copies of the cached
+        object are returned instead of newly built ones. Use this when creating many objects of the same type. Nested
+        objects are shared between the copies (see `copy_suds_object`).
         """
-        return self.get_client(self.service).factory.create(name)
+        if prototypes is not None:
+            if name not in prototypes:
+                prototypes[name] = self.factory(name)
+            return copy_suds_object(prototypes[name])
+
+        factory = self.get_client(self.service).factory
+        key = (self.service, name)
+        schema_type = _workday_types.get(key)
+        if schema_type is None:
+            schema_type = factory.resolver.find(name)
+            # Let suds deal with unknown types and enums
+            if schema_type is None or schema_type.enum():
+                return factory.create(name)
+            _workday_types[key] = schema_type
+        return factory.builder.build(schema_type)
@@ -1,5 +1,11 @@
+from copy import copy
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
 from suds.sudsobject import Object, asdict  # type: ignore
 
+T = TypeVar("T")
+
 
 def suds_to_dict(d: Object) -> dict:
     """
@@ -22,3 +28,30 @@ def suds_to_dict(d: Object) -> dict:
         else:
             out[k] = v
     return out
+
+
+def copy_suds_object(obj: Object) -> Object:
+    """
+    Make a shallow copy of a suds object, which is a lot cheaper than building a new one from the WSDL schema.
+
+    The list of keys and all list values are copied, so setting new attributes or appending to lists on the copy won't
+    affect the original. Nested objects are shared with the original, and must be replaced rather than mutated.
+    """
+    clone = copy(obj)
+    clone.__keylist__ = list(obj.__keylist__)
+    for key in obj.__keylist__:
+        value = getattr(obj, key)
+        if isinstance(value, list):
+            setattr(clone, key, list(value))
+    return clone
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of `size` items, where the last list might be shorter
+
+    Equivalent to `itertools.batched` from Python 3.12, but yielding lists
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -1,14 +1,27 @@
-from base64 import b64encode
-from typing import Self
+import mimetypes
+from functools import cache
+from typing import ClassVar, Self
 
 import magic
 from pydantic import BaseModel
 from suds import sudsobject
 
 from oda_wd_client.base.api import WorkdayClient
-from oda_wd_client.base.utils import get_id_from_list
+from oda_wd_client.base.utils import get_ids_by_type
 
-mime = magic.Magic(mime=True)
+try:
+    # SIMD accelerated, and a lot faster than the standard library for large files
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+
+@cache
+def _mime() -> magic.Magic:
+    """
+    Loading the libmagic database is slow and memory hungry, so we only do it the first time it's needed
+    """
+    return magic.Magic(mime=True)
 
 
 class WorkdayReferenceBaseModel(BaseModel):
@@ -19,26 +32,58 @@ class WorkdayReferenceBaseModel(BaseModel):
     workday_id and workday_id_type.
     """
 
+    class Config:
+        # References are plain pointers to objects in Workday, so instances are immutable (and thereby hashable), and
+        # can safely be shared - also when nested in other models, where pydantic would otherwise copy them
+        frozen = True
+        allow_population_by_field_name = True
+        copy_on_model_validation = "none"
+
     workday_id: str | None
-    workday_id_type: str
+    # Type of the Workday ID. Same for all instances of a class, so it's set on each subclass instead of as a field
+    workday_id_type: ClassVar[str]
     workday_parent_id: str | None = None
     workday_parent_type: str | None = None
 
     # This is the name of the class in Workday. Usually ends with "Object" (i.e. "SupplierObject")
     _class_name: str | None = None
+    # Factory type names for the reference object and its ID objects, derived from _class_name
+    _wd_type_name: str | None = None
+    _wd_id_type_name: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._class_name:
+            cls._wd_type_name = f"ns0:{cls._class_name}Type"
+            cls._wd_id_type_name = f"ns0:{cls._class_name}IDType"
 
     def wd_object(
         self,
         client: WorkdayClient,
         class_name: str | None = None,
+        prototypes: dict[str, sudsobject.Object] | None = None,
     ) -> sudsobject.Object:
-        class_name = class_name or self._class_name
+        """
+        Generate a reference object for use in requests to Workday
+
+        :param client: Client for the service the reference is used with
+        :param class_name: Override the class name defined on the class
+        :param prototypes: Passed on to `client.factory()`, to copy rather than build objects
+        """
+        type_name: str | None
+        id_type_name: str | None
+        if class_name:
+            type_name = f"ns0:{class_name}Type"
+            id_type_name = f"ns0:{class_name}IDType"
+        else:
+            type_name = self._wd_type_name
+            id_type_name = self._wd_id_type_name
         assert (
-            class_name
+            type_name and id_type_name
         ), "WD Class name must be supplied on class or call to wd_object"
 
-        ref_obj = client.factory(f"ns0:{class_name}Type")
-        id_obj = client.factory(f"ns0:{class_name}IDType")
+        ref_obj = client.factory(type_name, prototypes)
+        id_obj = client.factory(id_type_name, prototypes)
         id_obj.value = self.workday_id
         id_obj._type = self.workday_id_type
         if self.workday_parent_id:
@@ -67,20 +112,19 @@ class WorkdayReferenceBaseModel(BaseModel):
         `get_id_from_list(id_list, "Field_ID")` would give us "ABC".
 
         As the "field ID" value is defined on Self, as `workday_id_type`, we can simplify this lookup, and directly
-        instantiate an instance based on the class definition and ID list.
+        instantiate an instance based on the class definition and ID list. The ID list comes from Workday and is
+        trusted, so the instance is created without validation.
 
         Example use:
             > SpendCategory.from_id_list(data["Spend_Category_Reference"]["ID"])
 
         :param id_list: List of IDs
-        :param extra: Arbitrary kwargs are passed onto `cls.__init__()`
+        :param extra: Arbitrary kwargs are passed onto `cls.construct()`
         :return: instance of Self
         """
-        workday_id = get_id_from_list(
-            id_list, cls.__fields__["workday_id_type"].default
-        )
+        workday_id = get_ids_by_type(id_list).get(cls.workday_id_type)
         if workday_id:
-            return cls(workday_id=workday_id, **extra)
+            return cls.construct(workday_id=workday_id, **extra)
         return None
 
 
@@ -102,12 +146,15 @@ class File(BaseModel):
 
     def wd_object(self, client: WorkdayClient):
         doc = client.factory(f"ns0:{self.field_type}")
-        doc.File_Content = b64encode(self.file_content).decode("utf-8")
+        # Base64 output is always ASCII, which is cheaper to decode than UTF-8
+        doc.File_Content = b64encode(self.file_content).decode("ascii")
         doc._Filename = self.filename
         doc._Content_Type = self.content_type or self._get_content_type()
         if self.comment:
             doc.Comment = self.comment
         return doc
 
-    def _get_content_type(self):
-        return mime.from_buffer(self.file_content)
+    def _get_content_type(self) -> str:
+        # Most files have a known extension, so we only inspect the file content when we have to
+        content_type, _ = mimetypes.guess_type(self.filename)
+        return content_type or _mime().from_buffer(self.file_content)
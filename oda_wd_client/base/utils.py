@@ -12,7 +12,7 @@ def get_id_from_list(id_list: list, id_type: str) -> str | None:
     Will return the first ID matching the type (there should only be one), or None if no ID matches the type.
 
     Args:
-        id_list: List of ID dicts (not suds objects) from Workday
+        id_list: List of IDs from Workday, either as suds objects or as dicts from `suds_to_dict`
         id_type: The value we'll use to filter on _type
     """
     ids = [ref["value"] for ref in id_list if ref["_type"] == id_type]
@@ -21,6 +21,33 @@ def get_id_from_list(id_list: list, id_type: str) -> str | None:
     return None
 
 
+def get_ids_by_type(id_list: list) -> dict[str, str]:
+    """
+    Map all IDs in an ID list by their type, for when we need more than one lookup, or want O(1) lookups.
+
+    If there are multiple IDs with the same type, the first one is used, like in `get_id_from_list`.
+
+    Args:
+        id_list: List of IDs from Workday, either as suds objects or as dicts from `suds_to_dict`
+    """
+    return {ref["_type"]: ref["value"] for ref in reversed(id_list)}
+
+
+def get_wid(id_list: list) -> str | None:
+    """
+    Get the Workday ID (WID) from an ID list
+
+    If there are multiple WIDs, the first one is used, like in `get_id_from_list` and `get_ids_by_type`.
+
+    Args:
+        id_list: List of IDs from Workday, either as suds objects or as dicts from `suds_to_dict`
+    """
+    for ref in id_list:
+        if ref["_type"] == "WID":
+            return ref["value"]
+    return None
+
+
 def parse_workday_date(val):
     if isinstance(val, str):
         return datetime.strptime(val, WORKDAY_DATE_FORMAT).date()
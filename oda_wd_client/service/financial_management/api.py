@@ -1,9 +1,11 @@
-from typing import Iterator
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator
 
 from suds import sudsobject
 
 from oda_wd_client.base.api import WorkdayClient
-from oda_wd_client.base.tools import suds_to_dict
 from oda_wd_client.service.financial_management.types import (
     AccountingJournalData,
     Company,
@@ -26,30 +28,40 @@ from oda_wd_client.service.financial_management.utils import (
     workday_spend_category_to_pydantic,
     workday_tax_applicability_to_pydantic,
 )
+from oda_wd_client.service.resource_management.types import TaxApplicability
 
 
 class FinancialManagement(WorkdayClient):
     service = "Financial_Management"
 
     def get_currency_rates(
-        self, return_suds_object=False
-    ) -> Iterator[sudsobject.Object | ConversionRate]:
+        self,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[sudsobject.Object | ConversionRate | list]:
         method = "Get_Currency_Conversion_Rates"
-        results = self._get_paginated(method, "Currency_Conversion_Rate")
-        for rate in results:
-            yield rate if return_suds_object else workday_conversion_rate_to_pydantic(
-                suds_to_dict(rate)
-            )
+        results = self._get_paginated(
+            method, "Currency_Conversion_Rate", workers=workers
+        )
+        yield from self._parse_results(
+            results, workday_conversion_rate_to_pydantic, return_suds_object, batch_size
+        )
 
     def get_currency_rate_types(
-        self, return_suds_object=False
-    ) -> Iterator[sudsobject.Object | ConversionRateType]:
+        self,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[sudsobject.Object | ConversionRateType | list]:
         method = "Get_Currency_Rate_Types"
-        results = self._get_paginated(method, "Currency_Rate_Type")
-        for rate_type in results:
-            yield rate_type if return_suds_object else workday_conversion_rate_type_to_pydantic(
-                suds_to_dict(rate_type)
-            )
+        results = self._get_paginated(method, "Currency_Rate_Type", workers=workers)
+        yield from self._parse_results(
+            results,
+            workday_conversion_rate_type_to_pydantic,
+            return_suds_object,
+            batch_size,
+        )
 
     def put_currency_rate(self, rate: ConversionRate) -> sudsobject.Object:
         data_object = pydantic_conversion_rate_to_workday(rate, client=self)
@@ -57,69 +69,118 @@ class FinancialManagement(WorkdayClient):
             "Put_Currency_Conversion_Rate", Currency_Conversion_Rate_Data=data_object
         )
 
+    async def aput_currency_rate(self, rate: ConversionRate) -> sudsobject.Object:
+        """
+        Same as `put_currency_rate`, but the request is done in a worker thread, so it doesn't block the event loop
+
+        The data object is built on the calling thread, and only the request itself is handed to the worker thread
+        """
+        data_object = pydantic_conversion_rate_to_workday(rate, client=self)
+        return await asyncio.to_thread(
+            self._threaded_request,
+            "Put_Currency_Conversion_Rate",
+            Currency_Conversion_Rate_Data=data_object,
+        )
+
+    def put_currency_rates(
+        self, rates: Iterable[ConversionRate], concurrency: int = 8
+    ) -> list[sudsobject.Object]:
+        """
+        Upload many currency rates, with up to `concurrency` requests to Workday in flight at the same time
+
+        Responses are returned in the same order as the rates were given. All data objects are built on the calling
+        thread, as the factory and prototypes are not thread safe. Only the requests are done by the worker threads.
+        """
+        prototypes: dict[str, sudsobject.Object] = {}
+        data_objects = [
+            pydantic_conversion_rate_to_workday(
+                rate, client=self, prototypes=prototypes
+            )
+            for rate in rates
+        ]
+        request = partial(self._threaded_request, "Put_Currency_Conversion_Rate")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(
+                executor.map(
+                    lambda data_object: request(
+                        Currency_Conversion_Rate_Data=data_object
+                    ),
+                    data_objects,
+                )
+            )
+
     def get_cost_centers(
-        self, return_suds_object=False
-    ) -> Iterator[sudsobject.Object | CostCenterWorktag]:
+        self,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[sudsobject.Object | CostCenterWorktag | list]:
         method = "Get_Cost_Centers"
-        results = self._get_paginated(method, "Cost_Center")
-        for cost_center in results:
-            yield cost_center if return_suds_object else workday_cost_center_to_pydantic(
-                suds_to_dict(cost_center)
-            )
+        results = self._get_paginated(method, "Cost_Center", workers=workers)
+        yield from self._parse_results(
+            results, workday_cost_center_to_pydantic, return_suds_object, batch_size
+        )
 
     def get_companies(
-        self, return_suds_object=False
-    ) -> Iterator[sudsobject.Object | Company]:
+        self,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[sudsobject.Object | Company | list]:
         method = "Get_Workday_Companies"
-        results = self._get_paginated(method, "Company")
-        for company in results:
-            yield company if return_suds_object else workday_company_to_pydantic(
-                suds_to_dict(company)
-            )
+        results = self._get_paginated(method, "Company", workers=workers)
+        yield from self._parse_results(
+            results, workday_company_to_pydantic, return_suds_object, batch_size
+        )
 
     def get_currencies(
-        self, return_suds_object=False
-    ) -> Iterator[sudsobject.Object | Currency]:
+        self, return_suds_object: bool = False, batch_size: int | None = None
+    ) -> Iterator[sudsobject.Object | Currency | list]:
         method = "GetAll_Currencies"
         response = self._request(method)
         results = response.Currency_Data
-        for currency in results:
-            yield currency if return_suds_object else workday_currency_to_pydantic(
-                suds_to_dict(currency)
-            )
+        yield from self._parse_results(
+            results, workday_currency_to_pydantic, return_suds_object, batch_size
+        )
 
     def get_projects(
-        self, return_suds_object: bool = False
-    ) -> Iterator[sudsobject.Object | ProjectWorktag]:
+        self,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[sudsobject.Object | ProjectWorktag | list]:
         method = "Get_Basic_Projects"
-        results = self._get_paginated(method, "Basic_Project")
-        for project in results:
-            yield project if return_suds_object else workday_project_to_pydantic(
-                suds_to_dict(project)
-            )
+        results = self._get_paginated(method, "Basic_Project", workers=workers)
+        yield from self._parse_results(
+            results, workday_project_to_pydantic, return_suds_object, batch_size
+        )
 
     def get_spend_categories(
-        self, return_suds_object: bool = False
-    ) -> Iterator[sudsobject.Object | SpendCategory]:
+        self,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[sudsobject.Object | SpendCategory | list]:
         method = "Get_Resource_Categories"
-        results = self._get_paginated(method, "Resource_Category")
-        for category in results:
-            yield category if return_suds_object else workday_spend_category_to_pydantic(
-                suds_to_dict(category)
-            )
+        results = self._get_paginated(method, "Resource_Category", workers=workers)
+        yield from self._parse_results(
+            results, workday_spend_category_to_pydantic, return_suds_object, batch_size
+        )
 
     def get_tax_applicabilities(
-        self, return_suds_object: bool = False
-    ) -> Iterator[sudsobject.Object | dict]:
+        self,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[sudsobject.Object | TaxApplicability | list]:
         method = "Get_Tax_Applicabilities"
-        results = self._get_paginated(method, "Tax_Applicability")
-        for tax_applicability in results:
-            if return_suds_object:
-                yield tax_applicability
-            else:
-                yield workday_tax_applicability_to_pydantic(
-                    suds_to_dict(tax_applicability)
-                )
+        results = self._get_paginated(method, "Tax_Applicability", workers=workers)
+        yield from self._parse_results(
+            results,
+            workday_tax_applicability_to_pydantic,
+            return_suds_object,
+            batch_size,
+        )
 
     def submit_accounting_journal(
         self, journal: AccountingJournalData
@@ -128,3 +189,19 @@ class FinancialManagement(WorkdayClient):
         return self._request(
             "Submit_Accounting_Journal", Accounting_Journal_Data=data_object
         )
+
+    async def asubmit_accounting_journal(
+        self, journal: AccountingJournalData
+    ) -> sudsobject.Object:
+        """
+        Same as `submit_accounting_journal`, but the request is done in a worker thread, so it doesn't block the event
+        loop
+
+        The data object is built on the calling thread, and only the request itself is handed to the worker thread
+        """
+        data_object = pydantic_accounting_journal_to_workday(journal, client=self)
+        return await asyncio.to_thread(
+            self._threaded_request,
+            "Submit_Accounting_Journal",
+            Accounting_Journal_Data=data_object,
+        )
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Literal
+from typing import ClassVar, Literal
 
 from pydantic import BaseModel, Field
 
@@ -16,6 +16,9 @@ class ConversionRate(BaseModel):
     Reference: https://community.workday.com/sites/default/files/file-hosting/productionapi/Financial_Management/v40.2/Put_Currency_Conversion_Rate.html#Currency_Conversion_Rate_DataType  # noqa
     """
 
+    class Config:
+        frozen = True
+
     class RateTypeID(str, Enum):
         # Text reference to Conversion_Rate_Type in Workday
         current = "Current"
@@ -38,6 +41,9 @@ class ConversionRateType(BaseModel):
     Reference: https://community.workday.com/sites/default/files/file-hosting/productionapi/Financial_Management/v40.2/Put_Currency_Conversion_Rate.html#Currency_Rate_TypeObjectType  # noqa
     """
 
+    class Config:
+        frozen = True
+
     workday_id: str
     text_id: str | None
     description: str
@@ -51,7 +57,7 @@ class Currency(WorkdayReferenceBaseModel):
 
     _class_name = "CurrencyObject"
     workday_id: str = Field(max_length=3, alias="currency_code")
-    workday_id_type: Literal["Currency_ID"] = "Currency_ID"
+    workday_id_type: ClassVar[str] = "Currency_ID"
     description: str | None = None
     retired: bool = False
 
@@ -63,7 +69,7 @@ class Company(WorkdayReferenceBaseModel):
 
     _class_name = "CompanyObject"
     workday_id: str
-    workday_id_type: Literal["Company_Reference_ID"] = "Company_Reference_ID"
+    workday_id_type: ClassVar[str] = "Company_Reference_ID"
     name: str | None
     currency: Currency | None
     country_code: str | None = Field(max_length=2)
@@ -81,7 +87,7 @@ class JournalSource(WorkdayReferenceBaseModel):
         spreadsheet_upload = "Spreadsheet_Upload"
 
     _class_name = "Journal_SourceObject"
-    workday_id_type: Literal["Journal_Source_ID"] = "Journal_Source_ID"
+    workday_id_type: ClassVar[str] = "Journal_Source_ID"
 
 
 class LedgerType(WorkdayReferenceBaseModel):
@@ -98,7 +104,7 @@ class LedgerType(WorkdayReferenceBaseModel):
         historic_actuals = "Historic_Actuals"
 
     _class_name = "Ledger_TypeObject"
-    workday_id_type: Literal["Ledger_Type_ID"] = "Ledger_Type_ID"
+    workday_id_type: ClassVar[str] = "Ledger_Type_ID"
 
 
 class SpendCategory(WorkdayReferenceBaseModel):
@@ -110,7 +116,7 @@ class SpendCategory(WorkdayReferenceBaseModel):
 
     _class_name = "Spend_CategoryObject"
     workday_id: str
-    workday_id_type: Literal["Spend_Category_ID"] = "Spend_Category_ID"
+    workday_id_type: ClassVar[str] = "Spend_Category_ID"
     name: str | None
     inactive: bool = False
 
@@ -125,7 +131,7 @@ class CostCenterWorktag(WorkdayReferenceBaseModel):
 
     _class_name = "Accounting_WorktagObject"
     workday_id: str
-    workday_id_type: Literal["Cost_Center_Reference_ID"] = "Cost_Center_Reference_ID"
+    workday_id_type: ClassVar[str] = "Cost_Center_Reference_ID"
     name: str | None
 
 
@@ -139,7 +145,7 @@ class ProjectWorktag(WorkdayReferenceBaseModel):
 
     _class_name = "Accounting_WorktagObject"
     workday_id: str
-    workday_id_type: Literal["Project_ID"] = "Project_ID"
+    workday_id_type: ClassVar[str] = "Project_ID"
     name: str | None
     inactive: bool = False
 
@@ -153,7 +159,7 @@ class LedgerAccount(WorkdayReferenceBaseModel):
 
     _class_name = "Ledger_AccountObject"
     workday_id: str
-    workday_id_type: Literal["Ledger_Account_ID"] = "Ledger_Account_ID"
+    workday_id_type: ClassVar[str] = "Ledger_Account_ID"
     workday_parent_id: str
     workday_parent_type: Literal["Account_Set_ID"] = "Account_Set_ID"
 
@@ -166,6 +172,11 @@ class JournalEntryLineData(BaseModel):
     Reference: https://community.workday.com/sites/default/files/file-hosting/productionapi/Financial_Management/v40.2/Submit_Accounting_Journal.html#Journal_Entry_Line_DataType  # noqa
     """
 
+    class Config:
+        frozen = True
+        # Lines that are already validated are reused as-is when building an AccountingJournalData
+        copy_on_model_validation = "none"
+
     ledger_account: LedgerAccount
     debit: Decimal | None = None
     credit: Decimal | None = None
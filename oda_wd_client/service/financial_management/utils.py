@@ -1,7 +1,10 @@
+from collections import OrderedDict
+
 from suds import sudsobject
 
 from oda_wd_client.base.api import WorkdayClient
-from oda_wd_client.base.utils import get_id_from_list
+from oda_wd_client.base.tools import copy_suds_object
+from oda_wd_client.base.utils import get_ids_by_type, get_wid
 from oda_wd_client.service.financial_management.types import (
     AccountingJournalData,
     Company,
@@ -10,32 +13,35 @@ from oda_wd_client.service.financial_management.types import (
     CostCenterWorktag,
     Currency,
     JournalEntryLineData,
+    JournalSource,
+    LedgerType,
     ProjectWorktag,
     SpendCategory,
 )
 from oda_wd_client.service.resource_management.types import TaxApplicability
 
+# Plain dict lookup of rate types by their Workday ID, which is cheaper than calling the enum class for every rate
+_RATE_TYPE_ID_BY_VALUE = {
+    rate_type.value: rate_type for rate_type in ConversionRate.RateTypeID
+}
+
 
-def workday_conversion_rate_to_pydantic(data: dict) -> ConversionRate:
+def workday_conversion_rate_to_pydantic(data: sudsobject.Object) -> ConversionRate:
     """
-    Create a ConversionRate pydantic object from a suds datadict from Workday
+    Create a ConversionRate pydantic object from a suds object from Workday
     """
-    workday_id = get_id_from_list(
-        data["Currency_Conversion_Rate_Reference"]["ID"], "WID"
-    )
-    assert len(data["Currency_Conversion_Rate_Data"]) == 1, (
+    workday_id = get_wid(data.Currency_Conversion_Rate_Reference.ID)
+    assert len(data.Currency_Conversion_Rate_Data) == 1, (
         "Code is written expecting that we only have one currency "
         "rate data per object, but that is not the case here"
     )
-    sub_data = data["Currency_Conversion_Rate_Data"][0]
-    from_ref = get_id_from_list(
-        sub_data["From_Currency_Reference"]["ID"], "Currency_ID"
+    sub_data = data.Currency_Conversion_Rate_Data[0]
+    from_ref = get_ids_by_type(sub_data.From_Currency_Reference.ID).get("Currency_ID")
+    target_ref = get_ids_by_type(sub_data.Target_Currency_Reference.ID).get(
+        "Currency_ID"
     )
-    target_ref = get_id_from_list(
-        sub_data["Target_Currency_Reference"]["ID"], "Currency_ID"
-    )
-    type_id = get_id_from_list(
-        sub_data["Currency_Rate_Type_Reference"]["ID"], "Currency_Rate_Type_ID"
+    type_id = get_ids_by_type(sub_data.Currency_Rate_Type_Reference.ID).get(
+        "Currency_Rate_Type_ID"
     )
 
     assert workday_id, "All currency conversion rates need a Workday ID"
@@ -45,126 +51,135 @@ def workday_conversion_rate_to_pydantic(data: dict) -> ConversionRate:
     ), "All currency conversion rates need a 'target currency'-reference"
     assert type_id, "All currency conversion rates need a 'rate type'-reference"
 
-    return ConversionRate(
+    # Data from Workday is trusted, so we skip validation when reading it (here and in the other parsers below)
+    return ConversionRate.construct(
         workday_id=workday_id,
         from_currency_iso=from_ref,
         to_currency_iso=target_ref,
-        rate=sub_data["Currency_Rate"],
-        rate_type_id=ConversionRate.RateTypeID(type_id),
-        effective_timestamp=sub_data["Effective_Timestamp"],
+        rate=sub_data.Currency_Rate,
+        rate_type_id=_RATE_TYPE_ID_BY_VALUE[type_id],
+        effective_timestamp=sub_data.Effective_Timestamp,
     )
 
 
-def workday_conversion_rate_type_to_pydantic(data: dict) -> ConversionRateType:
+def workday_conversion_rate_type_to_pydantic(
+    data: sudsobject.Object,
+) -> ConversionRateType:
     """
-    Create a ConversionRateType pydantic object from a suds datadict from Workday
+    Create a ConversionRateType pydantic object from a suds object from Workday
     """
-    workday_id = get_id_from_list(data["Currency_Rate_Type_Reference"]["ID"], "WID")
+    workday_id = get_wid(data.Currency_Rate_Type_Reference.ID)
     assert workday_id, "All currency conversion rate types need a Workday ID"
-    assert len(data["Currency_Rate_Type_Data"]) == 1, (
+    assert len(data.Currency_Rate_Type_Data) == 1, (
         "Code is written to expect that we only have one currency "
         "rate type data per object, but that is not the case here"
     )
-    sub_data = data["Currency_Rate_Type_Data"][0]
-    return ConversionRateType(
+    sub_data = data.Currency_Rate_Type_Data[0]
+    return ConversionRateType.construct(
         workday_id=workday_id,
-        text_id=sub_data["Currency_Rate_Type_ID"],
-        description=sub_data["Currency_Rate_Type_Description"],
-        is_default=sub_data["Currency_Rate_Type_Default"],
+        text_id=sub_data.Currency_Rate_Type_ID,
+        description=sub_data.Currency_Rate_Type_Description,
+        is_default=sub_data.Currency_Rate_Type_Default,
     )
 
 
-def workday_company_to_pydantic(data: dict) -> Company:
+def workday_company_to_pydantic(data: sudsobject.Object) -> Company:
     # For some weird reason, the object that holds the data for a specific company is wrapped in a list
     assert (
-        len(data["Company_Data"]) == 1
+        len(data.Company_Data) == 1
     ), "Company_Data for each company should be singular"
-    cdata = data["Company_Data"][0]
+    cdata = data.Company_Data[0]
 
-    currency_code = get_id_from_list(
-        cdata["Accounting_Data"]["Currency_Reference"]["ID"], "Currency_ID"
+    currency_code = get_ids_by_type(cdata.Accounting_Data.Currency_Reference.ID).get(
+        "Currency_ID"
     )
     # We'll expect that each company only has to care about taxation in one jurisdiction, and use the first object
     if "Tax_Status_Data" in cdata:
-        country_code = get_id_from_list(
-            cdata["Tax_Status_Data"][0]["Country_Reference"]["ID"],
-            "ISO_3166-1_Alpha-2_Code",
-        )
+        country_code = get_ids_by_type(
+            cdata.Tax_Status_Data[0].Country_Reference.ID
+        ).get("ISO_3166-1_Alpha-2_Code")
     else:
         country_code = None
 
-    return Company(
-        workday_id=cdata["Organization_Data"]["ID"],
-        name=cdata["Organization_Data"]["Organization_Name"],
+    return Company.construct(
+        workday_id=cdata.Organization_Data.ID,
+        name=cdata.Organization_Data.Organization_Name,
         country_code=country_code,
-        currency=Currency(currency_code=currency_code) if currency_code else None,
+        currency=Currency.construct(workday_id=currency_code)
+        if currency_code
+        else None,
     )
 
 
-def workday_currency_to_pydantic(data: dict) -> Currency:
-    return Currency(
-        currency_code=data["Currency_ID"],
-        description=data["Currency_Description"],
-        retired=data["Currency_Retired"],
+def workday_currency_to_pydantic(data: sudsobject.Object) -> Currency:
+    return Currency.construct(
+        workday_id=data.Currency_ID,
+        description=data.Currency_Description,
+        retired=data.Currency_Retired,
     )
 
 
-def workday_tax_applicability_to_pydantic(data: dict) -> TaxApplicability:
-    data = data["Tax_Applicability_Data"]
-    return TaxApplicability(
-        workday_id=data["Tax_Applicability_ID"],
-        code=data["Tax_Applicability_Code"],
-        taxable=data["Taxable"],
+def workday_tax_applicability_to_pydantic(data: sudsobject.Object) -> TaxApplicability:
+    data = data.Tax_Applicability_Data
+    return TaxApplicability.construct(
+        workday_id=data.Tax_Applicability_ID,
+        code=data.Tax_Applicability_Code,
+        taxable=data.Taxable,
     )
 
 
-def workday_cost_center_to_pydantic(data: dict) -> CostCenterWorktag:
-    cost_center_id = get_id_from_list(
-        data["Cost_Center_Reference"]["ID"], "Cost_Center_Reference_ID"
+def workday_cost_center_to_pydantic(data: sudsobject.Object) -> CostCenterWorktag:
+    cost_center_id = get_ids_by_type(data.Cost_Center_Reference.ID).get(
+        "Cost_Center_Reference_ID"
     )
     assert cost_center_id, "No ID of cost center found, this is required"
-    return CostCenterWorktag(
+    return CostCenterWorktag.construct(
         workday_id=cost_center_id,
-        name=data["Cost_Center_Data"]["Organization_Data"]["Organization_Name"],
+        name=data.Cost_Center_Data.Organization_Data.Organization_Name,
     )
 
 
-def workday_spend_category_to_pydantic(data: dict) -> SpendCategory:
-    cat_data = data["Resource_Category_Data"]
-    ref_id = get_id_from_list(
-        data["Resource_Category_Reference"]["ID"], "Spend_Category_ID"
+def workday_spend_category_to_pydantic(data: sudsobject.Object) -> SpendCategory:
+    cat_data = data.Resource_Category_Data
+    ref_id = get_ids_by_type(data.Resource_Category_Reference.ID).get(
+        "Spend_Category_ID"
     )
-    resource_id = cat_data["Resource_Category_ID"]
+    resource_id = cat_data.Resource_Category_ID
     assert (
         ref_id == resource_id
     ), "The Resource_Category_ID and Spend_Category_ID are expected to be equal"
 
-    return SpendCategory(
+    return SpendCategory.construct(
         workday_id=ref_id,
-        name=cat_data["Resource_Category_Name"],
-        inactive=cat_data["Inactive"],
+        name=cat_data.Resource_Category_Name,
+        inactive=cat_data.Inactive,
     )
 
 
-def workday_project_to_pydantic(data: dict) -> ProjectWorktag:
-    proj_data = data["Basic_Project_Data"]
-    return ProjectWorktag(
-        workday_id=proj_data["Project_ID"],
-        name=proj_data["Project_Name"],
-        inactive=proj_data["Inactive"],
+def workday_project_to_pydantic(data: sudsobject.Object) -> ProjectWorktag:
+    proj_data = data.Basic_Project_Data
+    return ProjectWorktag.construct(
+        workday_id=proj_data.Project_ID,
+        name=proj_data.Project_Name,
+        inactive=proj_data.Inactive,
     )
 
 
 def pydantic_conversion_rate_to_workday(
-    rate: ConversionRate, client: WorkdayClient
+    rate: ConversionRate,
+    client: WorkdayClient,
+    prototypes: dict[str, sudsobject.Object] | None = None,
 ) -> sudsobject.Object:
     """
     Create a suds object from a Pydantic object. Used for creating/updating conversion rates in Workday
+
+    Share a `prototypes` dict between calls when converting many rates, to copy objects rather than build them from
+    the WSDL (see `WorkdayClient.factory`)
     """
-    rate_data = client.factory("ns0:Currency_Conversion_Rate_DataType")
-    from_currency_id = client.factory("ns0:CurrencyObjectIDType")
-    target_currency_id = client.factory("ns0:CurrencyObjectIDType")
-    rate_type_id = client.factory("ns0:Currency_Rate_TypeObjectIDType")
+    rate_data = client.factory("ns0:Currency_Conversion_Rate_DataType", prototypes)
+    from_currency_id = client.factory("ns0:CurrencyObjectIDType", prototypes)
+    target_currency_id = client.factory("ns0:CurrencyObjectIDType", prototypes)
+    rate_type_id = client.factory("ns0:Currency_Rate_TypeObjectIDType", prototypes)
 
     # Populate objects
     rate_data.Effective_Timestamp = rate.effective_timestamp
@@ -176,13 +191,13 @@ def pydantic_conversion_rate_to_workday(
     # Stuff everything into the final object
     from_currency_id._type = "Currency_ID"
     target_currency_id._type = "Currency_ID"
-    from_currency = client.factory("ns0:CurrencyObjectType")
-    target_currency = client.factory("ns0:CurrencyObjectType")
+    from_currency = client.factory("ns0:CurrencyObjectType", prototypes)
+    target_currency = client.factory("ns0:CurrencyObjectType", prototypes)
     from_currency.ID.append(from_currency_id)
     target_currency.ID.append(target_currency_id)
     rate_type_id._type = "Currency_Rate_Type_ID"
     rate_type_id.value = rate.rate_type_id.value
-    rate_type = client.factory("ns0:Currency_Rate_TypeObjectType")
+    rate_type = client.factory("ns0:Currency_Rate_TypeObjectType", prototypes)
     rate_type.ID.append(rate_type_id)
     rate_data.From_Currency_Reference = from_currency
     rate_data.Target_Currency_Reference = target_currency
@@ -192,20 +207,26 @@ def pydantic_conversion_rate_to_workday(
 
 
 def _pydantic_journal_entry_line_to_workday(
-    journal_line: JournalEntryLineData, client: WorkdayClient
+    journal_line: JournalEntryLineData,
+    client: WorkdayClient,
+    prototypes: dict[str, sudsobject.Object],
 ) -> sudsobject.Object:
-    wd_journal_entry_line = client.factory("ns0:Journal_Entry_Line_DataType")
+    wd_journal_entry_line = client.factory(
+        "ns0:Journal_Entry_Line_DataType", prototypes
+    )
 
     wd_journal_entry_line.Ledger_Account_Reference = (
-        journal_line.ledger_account.wd_object(client)
+        journal_line.ledger_account.wd_object(client, prototypes=prototypes)
     )
 
     if journal_line.spend_category:
-        spend_category = journal_line.spend_category.wd_object(client)
+        spend_category = journal_line.spend_category.wd_object(
+            client, prototypes=prototypes
+        )
         wd_journal_entry_line.Worktags_Reference.append(spend_category)
 
     if journal_line.cost_center:
-        cost_center = journal_line.cost_center.wd_object(client)
+        cost_center = journal_line.cost_center.wd_object(client, prototypes=prototypes)
         wd_journal_entry_line.Worktags_Reference.append(cost_center)
 
     wd_journal_entry_line.Debit_Amount = journal_line.debit
@@ -214,29 +235,72 @@ def _pydantic_journal_entry_line_to_workday(
     return wd_journal_entry_line
 
 
+# Accounting journal objects with the references that are the same for all journals with the same company, ledger type
+# and journal source. The suds clients are shared by all client instances for a service, so the objects are keyed on
+# the service and the Workday IDs of the references, and only the most recently used ones are kept.
+_ACCOUNTING_JOURNAL_HEADERS_MAX_SIZE = 64
+_accounting_journal_headers: OrderedDict[
+    tuple[str, str | None, str | None, str | None, str | None], sudsobject.Object
+] = OrderedDict()
+
+
+def _accounting_journal_header(
+    client: WorkdayClient,
+    company: Company,
+    ledger_type: LedgerType,
+    journal_source: JournalSource,
+) -> sudsobject.Object:
+    """
+    Accounting journal object with the company, ledger type and journal source references set. The object is cached,
+    so it must be copied before use.
+    """
+    key = (
+        client.service,
+        company.workday_id,
+        company.currency.workday_id if company.currency else None,
+        ledger_type.workday_id,
+        journal_source.workday_id,
+    )
+    header = _accounting_journal_headers.get(key)
+    if header is None:
+        header = client.factory("ns0:Accounting_Journal_DataType")
+        header.Journal_Source_Reference = journal_source.wd_object(client)
+        if company.currency:
+            header.Currency_Reference = company.currency.wd_object(client)
+        header.Company_Reference = company.wd_object(client)
+        header.Ledger_Type_Reference = ledger_type.wd_object(client)
+        _accounting_journal_headers[key] = header
+        if len(_accounting_journal_headers) > _ACCOUNTING_JOURNAL_HEADERS_MAX_SIZE:
+            _accounting_journal_headers.popitem(last=False)
+    else:
+        _accounting_journal_headers.move_to_end(key)
+    return header
+
+
 def pydantic_accounting_journal_to_workday(
     journal: AccountingJournalData, client: WorkdayClient
 ) -> sudsobject.Object:
     """
     Create a suds object from a Pydantic object. Used for submitting accounting journals to Workday
     """
-    # create container object and add data
-    wd_accounting_journal = client.factory("ns0:Accounting_Journal_DataType")
+    # Integrations typically submit lots of journals for the same few companies, so the references that are the same
+    # across journals are only built once
+    wd_accounting_journal = copy_suds_object(
+        _accounting_journal_header(
+            client, journal.company, journal.ledger_type, journal.journal_source
+        )
+    )
     wd_accounting_journal.Accounting_Date = journal.accounting_date
     wd_accounting_journal.Accounting_Journal_ID = journal.accounting_journal_id
-    wd_accounting_journal.Journal_Source_Reference = journal.journal_source.wd_object(
-        client
-    )
-    if journal.company.currency:
-        wd_accounting_journal.Currency_Reference = journal.company.currency.wd_object(
-            client
-        )
-    wd_accounting_journal.Company_Reference = journal.company.wd_object(client)
-    wd_accounting_journal.Ledger_Type_Reference = journal.ledger_type.wd_object(client)
-    for journal_entry_line_data in journal.journal_entry_line_data:
-        wd_data = _pydantic_journal_entry_line_to_workday(
-            journal_entry_line_data, client
+
+    # Journals can have thousands of lines, all made up of the same few object types, so we build one object of each
+    # type from the WSDL and copy those for each line
+    prototypes: dict[str, sudsobject.Object] = {}
+    wd_accounting_journal.Journal_Entry_Line_Replacement_Data = [
+        _pydantic_journal_entry_line_to_workday(
+            journal_entry_line_data, client, prototypes
         )
-        wd_accounting_journal.Journal_Entry_Line_Replacement_Data.append(wd_data)
+        for journal_entry_line_data in journal.journal_entry_line_data
+    ]
 
     return wd_accounting_journal
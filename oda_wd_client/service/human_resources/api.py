@@ -4,7 +4,6 @@ from typing import Iterator
 from suds import WebFault, sudsobject
 
 from oda_wd_client.base.api import WorkdayClient
-from oda_wd_client.base.tools import suds_to_dict
 from oda_wd_client.service.human_resources.types import Worker
 from oda_wd_client.service.human_resources.utils import workday_worker_to_pydantic
 
@@ -13,8 +12,12 @@ class HumanResources(WorkdayClient):
     service = "Human_Resources"
 
     def get_workers(
-        self, as_of_date: date | None = None, return_suds_object: bool = False
-    ) -> Iterator[Worker | sudsobject.Object]:
+        self,
+        as_of_date: date | None = None,
+        return_suds_object: bool = False,
+        batch_size: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[Worker | sudsobject.Object | list]:
         """
         Get all workers
 
@@ -23,6 +26,9 @@ class HumanResources(WorkdayClient):
                 supply a date that is two weeks in the future, the data will include all employees starting over the
                 next two weeks.
             return_suds_object: If True, returns raw suds objects rather than a list of Worker instances
+            batch_size: If set, yields lists of up to `batch_size` workers rather than one worker at a time
+            workers: Number of pages to fetch concurrently, ahead of iteration. The default of 1 only fetches pages as
+                they're needed.
 
         """
         method = "Get_Workers"
@@ -30,11 +36,12 @@ class HumanResources(WorkdayClient):
         if as_of_date:
             filters["As_Of_Effective_Date"] = as_of_date
 
-        results = self._get_paginated(method, "Worker", filters=filters)
-        for worker in results:
-            yield worker if return_suds_object else workday_worker_to_pydantic(
-                suds_to_dict(worker)
-            )
+        results = self._get_paginated(
+            method, "Worker", filters=filters, workers=workers
+        )
+        yield from self._parse_results(
+            results, workday_worker_to_pydantic, return_suds_object, batch_size
+        )
 
     def _get_worker_by_id(
         self, id_: str, id_type: str, return_object: bool = False
@@ -60,7 +67,7 @@ class HumanResources(WorkdayClient):
         worker = response.Response_Data.Worker[0]
         if return_object:
             return worker
-        return workday_worker_to_pydantic(suds_to_dict(worker))
+        return workday_worker_to_pydantic(worker)
 
     def get_worker_by_workday_id(self, id_: str) -> Worker:
         """
@@ -1,5 +1,7 @@
 from typing import Optional, Tuple
 
+from suds import sudsobject
+
 from oda_wd_client.service.human_resources.types import Worker
 
 WORKDAY_EMAIL_TYPES = {"WORK": "work", "HOME": "secondary"}
@@ -11,18 +13,18 @@ def _parse_worker_emails(emails: list) -> dict[str, str]:
     """
     ret = {}
 
-    def _parse_address(data) -> Tuple[Optional[str], str]:
+    def _parse_address(email) -> Tuple[Optional[str], str]:
         usage_type_id = None
-        addr = email["Email_Address"]
-        for ud in email["Usage_Data"]:
-            for td in ud["Type_Data"]:
+        addr = email.Email_Address
+        for ud in email.Usage_Data:
+            for td in ud.Type_Data:
                 # Only use address if it's primary
-                is_primary = td["_Primary"]
+                is_primary = td._Primary
                 # Lookup usage type ID - denotes if the address is work or personal
                 usage_type_id = [
-                    d["value"]
-                    for d in td["Type_Reference"]["ID"]
-                    if d["_type"] == "Communication_Usage_Type_ID"
+                    d.value
+                    for d in td.Type_Reference.ID
+                    if d._type == "Communication_Usage_Type_ID"
                 ]
                 if is_primary and usage_type_id:
                     return usage_type_id[0], addr
@@ -38,12 +40,12 @@ def _parse_worker_emails(emails: list) -> dict[str, str]:
     return ret
 
 
-def _parse_worker_refs(refs: dict) -> Tuple[Optional[str], Optional[str]]:
+def _parse_worker_refs(refs: list) -> Tuple[Optional[str], Optional[str]]:
     workday_id = None
     employee_number = None
     for ref in refs:
-        _type = ref["_type"]
-        value = ref["value"]
+        _type = ref._type
+        value = ref.value
         if _type == "WID":
             workday_id = value
         elif _type == "Employee_ID":
@@ -51,20 +53,23 @@ def _parse_worker_refs(refs: dict) -> Tuple[Optional[str], Optional[str]]:
     return workday_id, employee_number
 
 
-def workday_worker_to_pydantic(data: dict) -> Worker:
+def workday_worker_to_pydantic(data: sudsobject.Object) -> Worker:
     """
     Workday objects are painful and complex creatures, and we want to normalize them to something
     which is much easier for us to use in Python.
+
+    Worker objects are large, so we read the few fields we need directly from the suds object rather than converting
+    the whole object with `suds_to_dict` first.
     """
     # Alias
-    worker_data = data["Worker_Data"]
-    refs = data["Worker_Reference"]["ID"]
-    personal_data = worker_data["Personal_Data"]
-    name_data = personal_data["Name_Data"]
-    emails_data = personal_data["Contact_Data"].get("Email_Address_Data", [])
+    worker_data = data.Worker_Data
+    refs = data.Worker_Reference.ID
+    personal_data = worker_data.Personal_Data
+    name_data = personal_data.Name_Data
+    emails_data = getattr(personal_data.Contact_Data, "Email_Address_Data", [])
 
     # Lookup
-    name = name_data["Legal_Name_Data"]["Name_Detail_Data"]["_Formatted_Name"]
+    name = name_data.Legal_Name_Data.Name_Detail_Data._Formatted_Name
 
     # Parsing
     workday_id, employee_number = _parse_worker_refs(refs)
@@ -73,7 +78,8 @@ def workday_worker_to_pydantic(data: dict) -> Worker:
     ), "We require Workday ID for worker objects. Something is very wrong if we cannot look that up."
     emails = _parse_worker_emails(emails_data)
 
-    return Worker(
+    # Data from Workday is trusted, so we skip validation
+    return Worker.construct(
         workday_id=workday_id,
         employee_number=employee_number,
         name=name,
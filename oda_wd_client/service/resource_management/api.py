@@ -17,10 +17,10 @@ class ResourceManagement(WorkdayClient):
     service = "Resource_Management"
 
     def get_suppliers(
-        self, return_suds_object=False
+        self, return_suds_object=False, workers: int = 1
     ) -> Iterator[sudsobject.Object | Supplier]:
         method = "Get_Suppliers"
-        results = self._get_paginated(method, "Supplier")
+        results = self._get_paginated(method, "Supplier", workers=workers)
         for supplier in results:
             try:
                 yield supplier if return_suds_object else workday_supplier_to_pydantic(
@@ -31,10 +31,10 @@ class ResourceManagement(WorkdayClient):
                 pass
 
     def get_supplier_invoices(
-        self, return_suds_object=False
+        self, return_suds_object=False, workers: int = 1
     ) -> Iterator[sudsobject.Object | SupplierInvoice]:
         method = "Get_Supplier_Invoices"
-        results = self._get_paginated(method, "Supplier_Invoice")
+        results = self._get_paginated(method, "Supplier_Invoice", workers=workers)
         for invoice in results:
             yield invoice if return_suds_object else workday_supplier_invoice_to_pydantic(
                 suds_to_dict(invoice)
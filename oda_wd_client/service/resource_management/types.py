@@ -1,11 +1,10 @@
 from datetime import date
 from decimal import Decimal
-from typing import Literal
+from typing import ClassVar
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 
 from oda_wd_client.base.types import File, WorkdayReferenceBaseModel
-from oda_wd_client.base.utils import parse_workday_date
 from oda_wd_client.service.financial_management.types import (
     Company,
     CostCenterWorktag,
@@ -25,7 +24,7 @@ class TaxApplicability(WorkdayReferenceBaseModel):
 
     _class_name = "Tax_ApplicabilityObject"
     workday_id: str
-    workday_id_type: Literal["Tax_Applicability_ID"] = "Tax_Applicability_ID"
+    workday_id_type: ClassVar[str] = "Tax_Applicability_ID"
     # Code is human-readable text but not critical, so we default to empty string
     code: str = ""
     taxable: bool = True
@@ -38,7 +37,7 @@ class TaxOption(WorkdayReferenceBaseModel):
 
     _class_name = "Tax_OptionObject"
     workday_id: str
-    workday_id_type: Literal["Tax_Option_ID"] = "Tax_Option_ID"
+    workday_id_type: ClassVar[str] = "Tax_Option_ID"
 
 
 class TaxCode(WorkdayReferenceBaseModel):
@@ -48,7 +47,7 @@ class TaxCode(WorkdayReferenceBaseModel):
 
     _class_name = "Tax_CodeObject"
     workday_id: str
-    workday_id_type: Literal["Tax_Code_ID"] = "Tax_Code_ID"
+    workday_id_type: ClassVar[str] = "Tax_Code_ID"
 
 
 class Supplier(WorkdayReferenceBaseModel):
@@ -58,7 +57,7 @@ class Supplier(WorkdayReferenceBaseModel):
 
     _class_name = "SupplierObject"
     workday_id: str
-    workday_id_type: Literal["Supplier_ID"] = "Supplier_ID"
+    workday_id_type: ClassVar[str] = "Supplier_ID"
     reference_id: str | None
     name: str | None
     payment_terms: str | None
@@ -108,7 +107,7 @@ class TaxRate(WorkdayReferenceBaseModel):
 
     _class_name = "Tax_RateObject"
     workday_id: str
-    workday_id_type: Literal["Tax_Rate_ID"] = "Tax_Rate_ID"
+    workday_id_type: ClassVar[str] = "Tax_Rate_ID"
 
 
 class TaxRecoverability(WorkdayReferenceBaseModel):
@@ -118,9 +117,13 @@ class TaxRecoverability(WorkdayReferenceBaseModel):
 
     _class_name = "Tax_RecoverabilityObject"
     workday_id: str
-    workday_id_type: Literal[
-        "Tax_Recoverability_Object_ID"
-    ] = "Tax_Recoverability_Object_ID"
+    workday_id_type: ClassVar[str] = "Tax_Recoverability_Object_ID"
+
+
+# Shared defaults for TaxRateOptionsData. References are immutable, so all instances can use the same objects, rather
+# than pydantic making a deep copy of the default for each of them.
+_DEFAULT_TAX_RECOVERABILITY = TaxRecoverability(workday_id="Fully_Recoverable")
+_DEFAULT_TAX_OPTION = TaxOption(workday_id="CALC_TAX_DUE")
 
 
 class TaxRateOptionsData(BaseModel):
@@ -132,10 +135,10 @@ class TaxRateOptionsData(BaseModel):
     """
 
     tax_rate: TaxRate
-    tax_recoverability: TaxRecoverability = TaxRecoverability(
-        workday_id="Fully_Recoverable"
+    tax_recoverability: TaxRecoverability = Field(
+        default_factory=lambda: _DEFAULT_TAX_RECOVERABILITY
     )
-    tax_option: TaxOption = TaxOption(workday_id="CALC_TAX_DUE")
+    tax_option: TaxOption = Field(default_factory=lambda: _DEFAULT_TAX_OPTION)
 
 
 class FinancialAttachmentData(File):
@@ -170,9 +173,11 @@ class SupplierInvoice(WorkdayReferenceBaseModel):
     Reference: https://community.workday.com/sites/default/files/file-hosting/productionapi/Resource_Management/v40.2/Submit_Supplier_Invoice.html#Supplier_Invoice_DataType  # noqa
     """
 
-    workday_id_type: Literal[
-        "Supplier_invoice_Reference_ID"
-    ] = "Supplier_invoice_Reference_ID"
+    class Config:
+        # Unlike other reference models, invoices are documents that are built up before being submitted
+        frozen = False
+
+    workday_id_type: ClassVar[str] = "Supplier_invoice_Reference_ID"
     invoice_number: str
     company: Company
     currency: Currency
@@ -185,7 +190,3 @@ class SupplierInvoice(WorkdayReferenceBaseModel):
 
     lines: list[SupplierInvoiceLine]
     attachments: list[FinancialAttachmentData] | None
-
-    _normalize_dates = validator("invoice_date", "due_date", allow_reuse=True)(
-        parse_workday_date
-    )
@@ -1,9 +1,14 @@
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
 
 from suds import sudsobject
 
 from oda_wd_client.base.api import WorkdayClient
-from oda_wd_client.base.utils import get_id_from_list
+from oda_wd_client.base.types import WorkdayReferenceBaseModel
+from oda_wd_client.base.utils import get_ids_by_type, parse_workday_date
 from oda_wd_client.service.financial_management.types import (
     Company,
     CostCenterWorktag,
@@ -26,22 +31,35 @@ from oda_wd_client.service.resource_management.types import (
 # Mapping the Workday tax ID types to canonical names used by our model
 # If the prefixes of this list were ISO 3166-compatible, we could just use those to match to country-specific fields,
 # but they're not (see Ireland), so we need a canonical mapping of our own.
-TAX_ID_SPEC = {
-    "AUT-UID": "tax_id_au",
-    "BEL-NOTVA": "tax_id_be",
-    "CHE-EID": "tax_id_ch",
-    "DEU-USTIDNR": "tax_id_de",
-    "DNK-MOMS": "tax_id_dk",
-    "ESP-IVA": "tax_id_es",
-    "FIN-ALV": "tax_id_fi",
-    "GBR-VATREGNO": "tax_id_gb",
-    "IRE-VATNO": "tax_id_ir",
-    "NLD-BTWNR": "tax_id_nl",
-    "NOR-VAT": "tax_id_no",
-    "POL-VATNIP": "tax_id_pl",
-    "SWE-MOMSNR": "tax_id_se",
-    "USA-EIN": "tax_id_us",
-}
+TAX_ID_SPEC = MappingProxyType(
+    {
+        "AUT-UID": "tax_id_au",
+        "BEL-NOTVA": "tax_id_be",
+        "CHE-EID": "tax_id_ch",
+        "DEU-USTIDNR": "tax_id_de",
+        "DNK-MOMS": "tax_id_dk",
+        "ESP-IVA": "tax_id_es",
+        "FIN-ALV": "tax_id_fi",
+        "GBR-VATREGNO": "tax_id_gb",
+        "IRE-VATNO": "tax_id_ir",
+        "NLD-BTWNR": "tax_id_nl",
+        "NOR-VAT": "tax_id_no",
+        "POL-VATNIP": "tax_id_pl",
+        "SWE-MOMSNR": "tax_id_se",
+        "USA-EIN": "tax_id_us",
+    }
+)
+_TAX_ID_LOOKUP = TAX_ID_SPEC.get
+
+# Account data for suppliers without a settlement account, which is common
+_EMPTY_ACCOUNT = {"iban": None, "bank_account": None}
+
+
+def _to_decimal(value: float | str) -> Decimal:
+    """
+    Suds gives us xsd:decimal values as floats. Convert them the same way pydantic would have done.
+    """
+    return Decimal(str(value))
 
 
 def _get_tax_id_from_dict(data: dict) -> dict:
@@ -52,11 +70,13 @@ def _get_tax_id_from_dict(data: dict) -> dict:
     ret = {}
 
     for tax_id_type in data.get("Tax_ID_Data", []):
-        type_ref_value = get_id_from_list(
-            tax_id_type["Tax_ID_Type_Reference"]["ID"], "Tax_ID_Type"
-        )
-        assert type_ref_value, "Tax ID type is an expected reference in this object"
-        type_name = TAX_ID_SPEC[type_ref_value]
+        type_ref_value = get_ids_by_type(
+            tax_id_type["Tax_ID_Type_Reference"]["ID"]
+        ).get("Tax_ID_Type", "")
+        type_name = _TAX_ID_LOOKUP(type_ref_value)
+        # Tax IDs without a type, or with a type we don't have a field for, are skipped
+        if type_name is None:
+            continue
         ret[type_name] = tax_id_type["Tax_ID_Text"]
 
     return ret
@@ -69,8 +89,11 @@ def _get_account_data_from_dict(data: dict) -> dict:
     The keys in the returned dict are defined by the Supplier pydantic model
     """
     settlement_data = data.get("Settlement_Account_Data", None)
+    if not settlement_data:
+        return _EMPTY_ACCOUNT.copy()
+
     # TODO: Add filtering to ensure we use the correct account
-    used = settlement_data[0] if settlement_data else {}
+    used = settlement_data[0]
 
     ret = {
         "iban": used.get("IBAN", None),
@@ -86,16 +109,18 @@ def _get_contact_data_from_dict(data: dict) -> dict:
 
     The keys in the returned dict are defined by the Supplier pydantic model
     """
-    ret = {}
+    ret: dict[str, str] = {}
     address_info = data.get("Address_Data", None)
     phone_info = data.get("Phone_Data", None)
     email_info = data.get("Email_Address_Data", None)
     url_info = data.get("Web_Address_Data", None)
 
+    # Suppliers without any of the contact information we use are common
+    if not (address_info or phone_info or email_info or url_info):
+        return ret
+
     if address_info:
-        current = sorted(
-            address_info, reverse=True, key=lambda addr: addr["_Effective_Date"]
-        )[0]
+        current = max(address_info, key=itemgetter("_Effective_Date"))
         # We'll just use the pre-formatted address from Workday as value
         ret["address"] = current["_Formatted_Address"].replace("&#xa;", "\n")
 
@@ -117,6 +142,8 @@ def _get_contact_data_from_dict(data: dict) -> dict:
 def workday_supplier_to_pydantic(data: dict) -> Supplier:
     """
     Parse a suds dict representing a supplier from Workday and return a Supplier pydantic instance
+
+    Data from Workday is trusted, so we skip validation when building the models here and in the other parsers below.
     """
     sup_data = data["Supplier_Data"]
     sup_id = sup_data.get("Supplier_ID", None)
@@ -131,16 +158,15 @@ def workday_supplier_to_pydantic(data: dict) -> Supplier:
     )
     currency_ref = sup_data.get("Currency_Reference", None)
 
-    return Supplier(
+    return Supplier.construct(
         workday_id=sup_id,
         reference_id=sup_data.get("Supplier_Reference_ID", None),
         name=sup_data["Supplier_Name"],
-        payment_terms=get_id_from_list(
-            sup_data.get("Payment_Terms_Reference", {}).get("ID", []),
-            "Payment_Terms_ID",
-        ),
+        payment_terms=get_ids_by_type(
+            sup_data.get("Payment_Terms_Reference", {}).get("ID", [])
+        ).get("Payment_Terms_ID"),
         # Currency_ID _should_ be in accordance with ISO 4217
-        currency=get_id_from_list(currency_ref["ID"], "Currency_ID")
+        currency=get_ids_by_type(currency_ref["ID"]).get("Currency_ID")
         if currency_ref
         else None,
         **contact_data,
@@ -151,12 +177,13 @@ def workday_supplier_to_pydantic(data: dict) -> Supplier:
 
 def _workday_invoice_line_to_pydantic(data: dict, order: int) -> SupplierInvoiceLine:
     cost_center = None
-    # Worktags is a list of tags, each with their own list of IDs
+    # Worktags is a list of tags, each with their own list of IDs. With more than one cost center the last one is used,
+    # so we look for it from the end.
     worktags = data["Worktags_Reference"]
-    for tag in worktags:
-        _cost_center = CostCenterWorktag.from_id_list(tag["ID"])
-        if _cost_center:
-            cost_center = _cost_center
+    for tag in reversed(worktags):
+        cost_center = CostCenterWorktag.from_id_list(tag["ID"])
+        if cost_center:
+            break
 
     tax_rate_options_data = None
     try:
@@ -169,7 +196,7 @@ def _workday_invoice_line_to_pydantic(data: dict, order: int) -> SupplierInvoice
         assert tax_option
         assert tax_rate
         assert tax_recoverability
-        tax_rate_options_data = TaxRateOptionsData(
+        tax_rate_options_data = TaxRateOptionsData.construct(
             tax_option=tax_option,
             tax_rate=tax_rate,
             tax_recoverability=tax_recoverability,
@@ -177,7 +204,7 @@ def _workday_invoice_line_to_pydantic(data: dict, order: int) -> SupplierInvoice
     except (KeyError, AssertionError):
         pass
 
-    return SupplierInvoiceLine(
+    return SupplierInvoiceLine.construct(
         order=order,
         description=data.get("Item_Description", ""),
         tax_rate_options_data=tax_rate_options_data,
@@ -189,46 +216,62 @@ def _workday_invoice_line_to_pydantic(data: dict, order: int) -> SupplierInvoice
             data["Spend_Category_Reference"]["ID"]
         ),
         cost_center=cost_center,
-        gross_amount=data["Extended_Amount"],
+        gross_amount=_to_decimal(data["Extended_Amount"]),
     )
 
 
+# Invoices mostly refer to the same few companies, currencies and suppliers. Reference models are immutable, so we can
+# share one instance for each of them across invoices.
+@lru_cache(maxsize=256)
+def _company_ref(workday_id: str) -> Company:
+    return Company.construct(workday_id=workday_id)
+
+
+@lru_cache(maxsize=256)
+def _currency_ref(workday_id: str) -> Currency:
+    return Currency.construct(workday_id=workday_id)
+
+
+@lru_cache(maxsize=256)
+def _supplier_ref(workday_id: str) -> Supplier:
+    return Supplier.construct(workday_id=workday_id)
+
+
 def workday_supplier_invoice_to_pydantic(data: dict) -> SupplierInvoice:
     data_list = data["Supplier_Invoice_Data"]
     assert len(data_list) == 1, "Expecting only one invoice in this dataset"
     inv: dict[str, Any] = data_list[0]
 
-    lines = []
-    for i, line in enumerate(
-        sorted(
-            inv["Invoice_Line_Replacement_Data"], key=lambda _line: _line["Line_Order"]
+    lines = [
+        _workday_invoice_line_to_pydantic(line, i)
+        for i, line in enumerate(
+            sorted(inv["Invoice_Line_Replacement_Data"], key=itemgetter("Line_Order"))
         )
-    ):
-        lines.append(_workday_invoice_line_to_pydantic(line, i))
+    ]
 
-    company_ref = get_id_from_list(
-        inv["Company_Reference"]["ID"], "Company_Reference_ID"
+    company_ref = get_ids_by_type(inv["Company_Reference"]["ID"]).get(
+        "Company_Reference_ID"
     )
-    currency_ref = get_id_from_list(inv["Currency_Reference"]["ID"], "Currency_ID")
-    supplier_ref = get_id_from_list(inv["Supplier_Reference"]["ID"], "Supplier_ID")
+    currency_ref = get_ids_by_type(inv["Currency_Reference"]["ID"]).get("Currency_ID")
+    supplier_ref = get_ids_by_type(inv["Supplier_Reference"]["ID"]).get("Supplier_ID")
 
     # Type narrowing
     assert company_ref is not None
     assert currency_ref is not None
     assert supplier_ref is not None
 
-    return SupplierInvoice(
-        workday_id=get_id_from_list(
-            data["Supplier_Invoice_Reference"]["ID"], "Supplier_Invoice_Reference_ID"
+    return SupplierInvoice.construct(
+        workday_id=get_ids_by_type(data["Supplier_Invoice_Reference"]["ID"]).get(
+            "Supplier_Invoice_Reference_ID"
         ),
         invoice_number=inv["Invoice_Number"],
-        company=Company(workday_id=company_ref),
-        currency=Currency(currency_code=currency_ref),
-        supplier=Supplier(workday_id=supplier_ref),
-        invoice_date=inv["Invoice_Date"],
-        due_date=inv["Due_Date_Override"],
-        total_amount=inv["Control_Amount_Total"],
-        tax_amount=inv["Tax_Amount"],
+        company=_company_ref(company_ref),
+        currency=_currency_ref(currency_ref),
+        supplier=_supplier_ref(supplier_ref),
+        invoice_date=parse_workday_date(inv["Invoice_Date"]),
+        due_date=parse_workday_date(inv["Due_Date_Override"]),
+        total_amount=_to_decimal(inv["Control_Amount_Total"]),
+        tax_amount=_to_decimal(inv["Tax_Amount"]),
         lines=lines,
     )
 
@@ -237,37 +280,50 @@ def _get_wd_invoice_lines_from_invoice(
     client, lines: list[SupplierInvoiceLine]
 ) -> list[sudsobject.Object]:
     returned_lines = []
+    # All lines are made up of the same few object types, so we build one object of each type from the WSDL and copy
+    # those for each line
+    prototypes: dict[str, sudsobject.Object] = {}
+
+    # The lines of an invoice usually share the same few references (tax rate, tax option, spend category etc.). The
+    # reference models are immutable, so we build the Workday object for each of them once, and reuse it across lines.
+    wd_refs: dict[tuple[type, WorkdayReferenceBaseModel], sudsobject.Object] = {}
+
+    def wd_ref(ref: WorkdayReferenceBaseModel) -> sudsobject.Object:
+        key = (type(ref), ref)
+        wd_obj = wd_refs.get(key)
+        if wd_obj is None:
+            wd_obj = wd_refs[key] = ref.wd_object(client, prototypes=prototypes)
+        return wd_obj
 
     for line in lines:
-        wd_line = client.factory("ns0:Supplier_Invoice_Line_Replacement_DataType")
+        wd_line = client.factory(
+            "ns0:Supplier_Invoice_Line_Replacement_DataType", prototypes
+        )
         wd_line.Line_Order = line.order
         wd_line.Item_Description = line.description
         wd_line.Extended_Amount = line.gross_amount
-        if line.spend_category:
-            wd_line.Spend_Category_Reference = line.spend_category.wd_object(client)
+
+        # Optional references: spend category, tax applicability and tax code
+        for attr, ref in (
+            ("Spend_Category_Reference", line.spend_category),
+            ("Tax_Applicability_Reference", line.tax_applicability),
+            ("Tax_Code_Reference", line.tax_code),
+        ):
+            if ref:
+                setattr(wd_line, attr, wd_ref(ref))
 
         # Tax options
         tax_opts = line.tax_rate_options_data
         if tax_opts:
-            wd_tax = client.factory("ns0:Tax_Rate_Options_DataType")
-            wd_tax.Tax_Rate_1_Reference = tax_opts.tax_rate.wd_object(client)
-            wd_tax.Tax_Recoverability_1_Reference = (
-                tax_opts.tax_recoverability.wd_object(client)
-            )
-            wd_tax.Tax_Option_1_Reference = tax_opts.tax_option.wd_object(client)
+            wd_tax = client.factory("ns0:Tax_Rate_Options_DataType", prototypes)
+            wd_tax.Tax_Rate_1_Reference = wd_ref(tax_opts.tax_rate)
+            wd_tax.Tax_Recoverability_1_Reference = wd_ref(tax_opts.tax_recoverability)
+            wd_tax.Tax_Option_1_Reference = wd_ref(tax_opts.tax_option)
             wd_line.Tax_Rate_Options_Data = wd_tax
 
-        # Tax code
-        if line.tax_applicability:
-            wd_line.Tax_Applicability_Reference = line.tax_applicability.wd_object(
-                client
-            )
-        if line.tax_code:
-            wd_line.Tax_Code_Reference = line.tax_code.wd_object(client)
-
         # Worktags
         if line.cost_center:
-            wd_line.Worktags_Reference.append(line.cost_center.wd_object(client))
+            wd_line.Worktags_Reference.append(wd_ref(line.cost_center))
 
         returned_lines.append(wd_line)
 
@@ -19,7 +19,7 @@ class Staffing(WorkdayClient):
         return self._request(method, *args, Add_Only=True, **kwargs)
 
     def get_documents(
-        self, raw_objects=False
+        self, raw_objects=False, workers: int = 1
     ) -> Iterable[Document | sudsobject.Object]:
         """
         Get all documents (as we can't filter on user...)
@@ -36,6 +36,7 @@ class Staffing(WorkdayClient):
             "Worker_Documents",
             per_page=25,
             extra_request_kwargs=extra_request_kwargs,
+            workers=workers,
         )
         for doc in docs:
             if raw_objects:
@@ -0,0 +1,166 @@
+import asyncio
+import re
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from suds.transport import Reply, Transport
+
+from oda_wd_client.base import api
+from oda_wd_client.base.api import WorkdayClient
+
+WSDL_URL = (Path(__file__).parent / "data" / "service.wsdl").resolve().as_uri()
+
+ENVELOPE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<env:Envelope xmlns:env="http://schemas.xmlsoap.org/soap/envelope/"><env:Body>{}</env:Body></env:Envelope>'
+)
+
+
+class FakeWorkday(Transport):
+    """
+    Answers requests to the test service, while keeping track of which threads and clients the requests came from
+    """
+
+    def __init__(self, log: list, pages: int, per_page: int = 2):
+        super().__init__()
+        self.log = log
+        self.pages = pages
+        self.per_page = per_page
+        self.in_flight = 0
+
+    def open(self, request):
+        raise NotImplementedError
+
+    def send(self, request):
+        # A suds client must only be used by one thread at a time
+        self.in_flight += 1
+        assert self.in_flight == 1, "Client used by more than one thread at a time"
+        try:
+            time.sleep(0.01)
+            message = request.message.decode()
+            page_match = re.search(r"Page>(\d+)<", message)
+            if page_match:
+                page = int(page_match.group(1))
+                self.log.append((page, threading.current_thread(), id(self)))
+                things = "".join(
+                    f"<wd:Thing>{page}-{i}</wd:Thing>" for i in range(self.per_page)
+                )
+                body = (
+                    '<wd:Get_Things_Response xmlns:wd="urn:com.workday/bsvc">'
+                    f"<wd:Response_Results><wd:Total_Results>{self.pages * self.per_page}</wd:Total_Results>"
+                    f"<wd:Total_Pages>{self.pages}</wd:Total_Pages></wd:Response_Results>"
+                    f"<wd:Response_Data>{things}</wd:Response_Data>"
+                    "</wd:Get_Things_Response>"
+                )
+            else:
+                name = re.search(r"Name>(.*?)<", message).group(1)  # type: ignore[union-attr]
+                self.log.append((name, threading.current_thread(), id(self)))
+                body = (
+                    '<wd:Put_Thing_Response xmlns:wd="urn:com.workday/bsvc">'
+                    f"<wd:Name>{name}</wd:Name></wd:Put_Thing_Response>"
+                )
+            return Reply(200, {}, ENVELOPE.format(body).encode())
+        finally:
+            self.in_flight -= 1
+
+
+class Things(WorkdayClient):
+    service = "Things"
+    # Set by the tests: number of pages the fake service has, and list to log requests to
+    pages = 1
+    log: list = []
+
+    def _get_client_url(self, service: str) -> str:
+        return WSDL_URL
+
+    def _setup_client(self, url: str):
+        client = super()._setup_client(url)
+        client.set_options(transport=FakeWorkday(self.log, self.pages))
+        return client
+
+
+class TestWorkdayClient(unittest.TestCase):
+    def setUp(self):
+        self.log: list = []
+        Things.log = self.log
+
+    def tearDown(self):
+        for registry in (api._workday_clients, api._workday_thread_clients):
+            registry.pop(Things.service, None)
+
+    def get_things(self, pages: int, workers: int) -> list[str]:
+        Things.pages = pages
+        client = Things("http://localhost", "tenant", "user", "password")
+        results = client._get_paginated(
+            "Get_Things", "Thing", per_page=2, workers=workers
+        )
+        return [str(thing) for thing in results]
+
+    def test_paginated_serial(self):
+        things = self.get_things(pages=3, workers=1)
+
+        self.assertEqual(things, [f"{p}-{i}" for p in range(1, 4) for i in range(2)])
+        self.assertEqual([page for page, *_ in self.log], [1, 2, 3])
+        main_thread = threading.main_thread()
+        self.assertTrue(all(thread is main_thread for _, thread, _ in self.log))
+
+    def test_paginated_threaded(self):
+        things = self.get_things(pages=7, workers=3)
+
+        self.assertEqual(things, [f"{p}-{i}" for p in range(1, 8) for i in range(2)])
+        self.assertEqual(sorted(page for page, *_ in self.log), list(range(1, 8)))
+        # The first page is fetched on the calling thread, and the rest from worker threads, on clients of their own
+        main_thread = threading.main_thread()
+        first_page, *other_pages = sorted(self.log, key=lambda entry: entry[0])
+        self.assertIs(first_page[1], main_thread)
+        self.assertTrue(all(thread is not main_thread for _, thread, _ in other_pages))
+        self.assertNotIn(first_page[2], {client for *_, client in other_pages})
+
+    def test_paginated_early_exit(self):
+        Things.pages = 5
+        client = Things("http://localhost", "tenant", "user", "password")
+        results = client._get_paginated("Get_Things", "Thing", per_page=2, workers=1)
+        next(results)
+        results.close()
+
+        self.assertEqual([page for page, *_ in self.log], [1])
+
+    def test_threaded_requests(self):
+        client = Things("http://localhost", "tenant", "user", "password")
+        # Data objects are built on the calling thread, like in FinancialManagement.put_currency_rates
+        data_objects = []
+        for i in range(8):
+            data = client.factory("ns0:Thing_DataType")
+            data.Name = f"thing-{i}"
+            data_objects.append(data)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(
+                executor.map(
+                    lambda data: client._threaded_request("Put_Thing", Thing_Data=data),
+                    data_objects,
+                )
+            )
+
+        self.assertEqual([str(r) for r in responses], [f"thing-{i}" for i in range(8)])
+        main_thread = threading.main_thread()
+        self.assertTrue(all(thread is not main_thread for _, thread, _ in self.log))
+
+    def test_threaded_request_from_event_loop(self):
+        client = Things("http://localhost", "tenant", "user", "password")
+        data = client.factory("ns0:Thing_DataType")
+        data.Name = "async-thing"
+
+        # Same pattern as FinancialManagement.aput_currency_rate
+        response = asyncio.run(
+            asyncio.to_thread(client._threaded_request, "Put_Thing", Thing_Data=data)
+        )
+
+        self.assertEqual(str(response), "async-thing")
+
+
+if __name__ == "__main__":
+    unittest.main()